@@ -55,6 +55,9 @@ class StandaloneDebuggerControlContext(AbstractDebuggerControlContext):
         self._static_data: Pmd2Data | None = None
         self._open_files: dict[str, SsbLoadedFile] = {}
         self._main_window = main_window
+        # Built lazily and reused; error storms would otherwise construct (and pango-
+        # layout) a fresh dialog per error.
+        self._error_dialog: Gtk.MessageDialog | None = None
 
     def allows_interactive_file_management(self) -> bool:
         return True
@@ -186,14 +189,17 @@ class StandaloneDebuggerControlContext(AbstractDebuggerControlContext):
         exc_info_str = ''
         if exc_info:
             exc_info_str = '\n' + ''.join(traceback.format_exception(exc_info[0], value=exc_info[1], tb=exc_info[2]))
-        md = self.message_dialog(self._main_window,
-                                 Gtk.DialogFlags.DESTROY_WITH_PARENT, Gtk.MessageType.ERROR,
-                                 Gtk.ButtonsType.OK,
-                                 f"{error_message}{exc_info_str}",
-                                 title=error_title)
-        md.set_position(Gtk.WindowPosition.CENTER)
+        if self._error_dialog is None:
+            self._error_dialog = self.message_dialog(self._main_window,
+                                                     Gtk.DialogFlags.DESTROY_WITH_PARENT, Gtk.MessageType.ERROR,
+                                                     Gtk.ButtonsType.OK,
+                                                     "")
+            self._error_dialog.set_position(Gtk.WindowPosition.CENTER)
+        md = self._error_dialog
+        md.set_title(error_title)
+        md.set_property('text', f"{error_message}{exc_info_str}")
         md.run()
-        md.destroy()
+        md.hide()
 
     def capture_error(
             self, exc_info,
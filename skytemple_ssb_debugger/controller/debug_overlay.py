@@ -16,9 +16,9 @@
 #  along with SkyTemple.  If not, see <https://www.gnu.org/licenses/>.
 from __future__ import annotations
 from typing import List, Tuple
-from collections.abc import Iterable
 
 import cairo
+import numpy as np
 from gi.repository import GLib
 
 from skytemple_files.script.ssa_sse_sss.position import TILE_SIZE
@@ -33,6 +33,21 @@ COLOR_EVENTS = (0, 0, 1.0, 0.4)
 COLOR_BLACK = (0, 0, 0, ALPHA_T)
 COLOR_POS_MARKERS = (0, 1.0, 0, ALPHA_T)
 
+# One solid pattern per color, built once: set_source_rgba would construct
+# a new pattern inside cairo on every call.
+PATTERN_ACTOR = cairo.SolidPattern(*COLOR_ACTOR)
+PATTERN_OBJECTS = cairo.SolidPattern(*COLOR_OBJECTS)
+PATTERN_PERFORMER = cairo.SolidPattern(*COLOR_PERFORMER)
+PATTERN_EVENTS = cairo.SolidPattern(*COLOR_EVENTS)
+PATTERN_POS_MARKERS = cairo.SolidPattern(*COLOR_POS_MARKERS)
+PATTERN_STROKE_BLACK = cairo.SolidPattern(0, 0, 0)
+
+_EMPTY_BBOXES: tuple[tuple[float, float, float, float], ...] = ()
+
+REDRAW_DELAY = 2000
+# Back off while the ground engine is not running; the caches can't change then.
+REDRAW_DELAY_IDLE = REDRAW_DELAY * 5
+
 
 class DebugOverlayController:
     def __init__(self, debugger: DebuggerController):
@@ -44,11 +59,19 @@ class DebugOverlayController:
         self._refresh_cache = True
         self._cache_running = False
         self._cache_redrawing_registered = False
-        self._actor_bbox_cache: list[tuple[int, int, int, int]] = []
-        self._object_bbox_cache: list[tuple[int, int, int, int]] = []
-        self._perf_bbox_cache: list[tuple[int, int, int, int]] = []
-        self._event_bbox_cache: list[tuple[int, int, int, int]] = []
+        self._draw_requested = False
+        # Interval of the currently installed update timer, None if no timer runs.
+        self._update_timeout_delay: int | None = None
+        # Immutable tuples of (x, y, width, height) rows, one per entity. Immutability
+        # guarantees a draw can iterate a published snapshot without any synchronization.
+        self._actor_bbox_cache: tuple[tuple[float, float, float, float], ...] = _EMPTY_BBOXES
+        self._object_bbox_cache: tuple[tuple[float, float, float, float], ...] = _EMPTY_BBOXES
+        self._perf_bbox_cache: tuple[tuple[float, float, float, float], ...] = _EMPTY_BBOXES
+        self._event_bbox_cache: tuple[tuple[float, float, float, float], ...] = _EMPTY_BBOXES
         self._camera_pos_cache = (0, 0)
+        # Hash over the last collected boxes + camera position, used to skip
+        # rebuilding the arrays when nothing moved since the previous tick.
+        self._last_fingerprint: int | None = None
         self._boost = False
 
     def toggle(self, state):
@@ -60,69 +83,77 @@ class DebugOverlayController:
             return
         # TODO: Support other display drawing.
         if display_id == 1 and self.enabled and self.debugger:
+            self._draw_requested = True
             if self._refresh_cache and not self._cache_redrawing_registered:
                 self._cache_redrawing_registered = True
                 self._update_cache()
 
             if self._cache_running:
+                # Snapshot the published caches once. _update_cache always builds fresh arrays
+                # and swaps them in with single assignments, so a snapshot is never partially
+                # populated, even if an update runs between two draws.
+                actor_boxes = self._actor_bbox_cache
+                object_boxes = self._object_bbox_cache
+                perf_boxes = self._perf_bbox_cache
+                event_boxes = self._event_bbox_cache
+                camera_pos = self._camera_pos_cache
                 # Draw
-                for bbox in self._actor_bbox_cache:
-                    ctx.set_source_rgba(*COLOR_ACTOR)
-                    ctx.rectangle(
-                        bbox[0], bbox[1],
-                        bbox[2] - bbox[0], bbox[3] - bbox[1]
-                    )
-                    ctx.fill()
-                for bbox in self._object_bbox_cache:
-                    ctx.set_source_rgba(*COLOR_OBJECTS)
-                    ctx.rectangle(
-                        bbox[0], bbox[1],
-                        bbox[2] - bbox[0], bbox[3] - bbox[1]
-                    )
-                    ctx.fill()
-                for bbox in self._perf_bbox_cache:
-                    ctx.set_source_rgba(*COLOR_PERFORMER)
-                    ctx.rectangle(
-                        bbox[0], bbox[1],
-                        bbox[2] - bbox[0], bbox[3] - bbox[1]
-                    )
-                    ctx.fill()
-                for bbox in self._event_bbox_cache:
-                    ctx.set_source_rgba(*COLOR_EVENTS)
-                    ctx.rectangle(
-                        bbox[0], bbox[1],
-                        bbox[2] - bbox[0], bbox[3] - bbox[1]
-                    )
-                    ctx.fill()
+                self._draw_group(ctx, PATTERN_ACTOR, actor_boxes)
+                self._draw_group(ctx, PATTERN_OBJECTS, object_boxes)
+                self._draw_group(ctx, PATTERN_PERFORMER, perf_boxes)
+                self._draw_group(ctx, PATTERN_EVENTS, event_boxes)
 
                 if self.debugger.ground_engine_state:
                     ground_state = self.debugger.ground_engine_state
                     for ssb in ground_state.loaded_ssb_files:
                         if ssb is not None:
                             for mark in ground_state.ssb_file_manager.get(ssb.file_name).position_markers:  # type: ignore
-                                x_absolute = (mark.x_with_offset * TILE_SIZE) - self._camera_pos_cache[0]
-                                y_absolute = (mark.y_with_offset * TILE_SIZE) - self._camera_pos_cache[1]
-                                ctx.set_source_rgba(*COLOR_POS_MARKERS)
+                                x_absolute = (mark.x_with_offset * TILE_SIZE) - camera_pos[0]
+                                y_absolute = (mark.y_with_offset * TILE_SIZE) - camera_pos[1]
+                                ctx.set_source(PATTERN_POS_MARKERS)
                                 ctx.rectangle(
                                     # They are centered.
                                     x_absolute - 4, y_absolute - 4,
                                     TILE_SIZE, TILE_SIZE
                                 )
                                 ctx.fill_preserve()
-                                ctx.set_source_rgb(0, 0, 0)
+                                ctx.set_source(PATTERN_STROKE_BLACK)
                                 ctx.set_line_width(1)
                                 ctx.stroke()
-                                ctx.set_source_rgba(*COLOR_POS_MARKERS)
+                                ctx.set_source(PATTERN_POS_MARKERS)
                                 ctx.move_to(x_absolute, y_absolute + 18)
                                 ctx.select_font_face("cairo:monospace", cairo.FONT_SLANT_NORMAL,
                                                     cairo.FONT_WEIGHT_NORMAL)
                                 ctx.set_font_size(8)
                                 ctx.text_path(mark.name)
                                 ctx.fill_preserve()
-                                ctx.set_source_rgb(0, 0, 0)
+                                ctx.set_source(PATTERN_STROKE_BLACK)
                                 ctx.set_line_width(0.3)
                                 ctx.stroke()
 
+    @staticmethod
+    def _bbox_array(boxes: list[tuple[int, int, int, int]]) -> tuple[tuple[float, float, float, float], ...]:
+        """
+        Convert a list of (x1, y1, x2, y2) boxes into an immutable tuple of
+        (x, y, width, height) rows. The subtraction is done vectorized over the whole
+        array; the Python-visible rows are materialized once here instead of per draw.
+        """
+        arr = np.asarray(boxes, dtype=np.float32).reshape(-1, 4)
+        arr[:, 2] -= arr[:, 0]
+        arr[:, 3] -= arr[:, 1]
+        return tuple(map(tuple, arr.tolist()))
+
+    @staticmethod
+    def _draw_group(ctx: cairo.Context, pattern: cairo.SolidPattern,
+                    boxes: tuple[tuple[float, float, float, float], ...]):
+        """Draw all boxes of one color group as a single path with a single fill."""
+        if not boxes:
+            return
+        ctx.set_source(pattern)
+        for x, y, w, h in boxes:
+            ctx.rectangle(x, y, w, h)
+        ctx.fill()
+
     def break_pulled(self):
         """The debugger is stopped, the emulator is frozen."""
         self._refresh_cache = False
@@ -132,31 +163,50 @@ class DebugOverlayController:
         self._refresh_cache = True
 
     def _update_cache(self):
-        # Refresh the cache
-        ges = self.debugger.ground_engine_state
+        # Only refresh when the overlay was actually drawn since the last update. This coalesces
+        # bursts of draws and makes the periodic callback a cheap no-op while nothing is painted.
+        ges = self.debugger.ground_engine_state if self._draw_requested else None
+        self._draw_requested = False
         if ges:
             self._cache_running = ges.running
             if self._cache_running:
-                self._actor_bbox_cache = []
-                self._object_bbox_cache = []
-                self._perf_bbox_cache = []
-                self._event_bbox_cache = []
                 ges.force_reload_ground_objects()
-                for actor in not_none(ges.actors):
-                    self._actor_bbox_cache.append(actor.get_bounding_box_camera(ges.map))
-                for object in not_none(ges.objects):
-                    self._object_bbox_cache.append(object.get_bounding_box_camera(ges.map))
-                for performer in not_none(ges.performers):
-                    self._perf_bbox_cache.append(performer.get_bounding_box_camera(ges.map))
-                for event in not_none(ges.events):
-                    self._event_bbox_cache.append(event.get_bounding_box_camera(ges.map))
-                self._camera_pos_cache = (ges.map.camera_x_pos, ges.map.camera_y_pos)
-
-        if self._refresh_cache and not self._boost:
-            GLib.timeout_add(2000, self._update_cache)
-        else:
+                boxes = ges.collect_bounding_boxes_camera()
+                camera_pos = (ges.map.camera_x_pos, ges.map.camera_y_pos)
+                fingerprint = hash((camera_pos, tuple(tuple(b) for b in boxes)))
+                if fingerprint != self._last_fingerprint:
+                    self._last_fingerprint = fingerprint
+                    actor_boxes, object_boxes, perf_boxes, event_boxes = boxes
+                    self._actor_bbox_cache = self._bbox_array(actor_boxes)
+                    self._object_bbox_cache = self._bbox_array(object_boxes)
+                    self._perf_bbox_cache = self._bbox_array(perf_boxes)
+                    self._event_bbox_cache = self._bbox_array(event_boxes)
+                    self._camera_pos_cache = camera_pos
+            else:
+                self._actor_bbox_cache = _EMPTY_BBOXES
+                self._object_bbox_cache = _EMPTY_BBOXES
+                self._perf_bbox_cache = _EMPTY_BBOXES
+                self._event_bbox_cache = _EMPTY_BBOXES
+                self._last_fingerprint = None
+
+        if not (self._refresh_cache and self.enabled and not self._boost):
             self._cache_redrawing_registered = False
-        return False
+            if not self.enabled:
+                # Only forget the running state when the overlay was turned off. This
+                # branch is also reached while broken (_refresh_cache cleared), and then
+                # draw() must keep painting the frozen caches.
+                self._cache_running = False
+            self._update_timeout_delay = None
+            return False
+        # Keep the installed timer source alive (return True) as long as the interval is
+        # unchanged; only install a new source when switching between the running and
+        # idle cadence. Cheaper than creating a fresh timeout per tick.
+        delay = REDRAW_DELAY if self._cache_running else REDRAW_DELAY_IDLE
+        if delay != self._update_timeout_delay:
+            self._update_timeout_delay = delay
+            GLib.timeout_add(delay, self._update_cache)
+            return False
+        return True
 
     def set_boost(self, state):
         self._boost = state
@@ -170,9 +220,3 @@ class DebugOverlayController:
             ctx.set_font_size(12)
             ctx.move_to(10, 30)
             ctx.show_text(_("Debugging disabled."))
-
-
-def not_none(it: Iterable):
-    for i in it:
-        if i is not None:
-            yield i
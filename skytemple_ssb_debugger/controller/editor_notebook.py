@@ -16,7 +16,7 @@
 #  You should have received a copy of the GNU General Public License
 #  along with SkyTemple.  If not, see <https://www.gnu.org/licenses/>.
 from __future__ import annotations
-import os
+from functools import lru_cache
 from typing import Dict, Optional, List, Tuple, TYPE_CHECKING, cast
 
 from gi.repository import Gtk, Pango
@@ -48,8 +48,17 @@ class EditorNotebookController:
         self.rom_data: Pmd2Data | None = None
         self._open_editors: dict[str, ScriptEditorController] = {}
         self._notebook = builder_get_assert(builder, Gtk.Notebook, 'code_editor_notebook')
+        # Maps the root widgets of open editors to their page numbers, so we don't have to ask
+        # the notebook to linearly scan its pages (Gtk.Notebook.page_num) on every operation.
+        self._page_num_by_root: dict[Gtk.Widget, int] = {}
+        self._notebook.connect('page-added', self._rebuild_page_num_cache)
+        self._notebook.connect('page-removed', self._rebuild_page_num_cache)
+        self._notebook.connect('page-reordered', self._rebuild_page_num_cache)
         self._cached_hanger_halt_lines: dict[str, list[tuple[SsbRoutineType, int, int]]] = {}
         self._cached_file_bpnt_state: BreakpointFileState | None = None
+        # States we already registered our release hook on; break_pulled can run
+        # multiple times for the same state and hooks would otherwise accumulate.
+        self._states_with_release_hook: set[BreakpointState] = set()
         self.enable_explorerscript = enable_explorerscript
         self._main_window = main_window
 
@@ -60,11 +69,10 @@ class EditorNotebookController:
 
     @property
     def currently_open(self) -> ScriptEditorController | None:
-        if self._notebook.get_current_page() > -1:
-            wdg = self._notebook.get_nth_page(self._notebook.get_current_page())
-            for c in self._open_editors.values():
-                if c.get_root_object() == wdg:
-                    return c
+        page = self._notebook.get_current_page()
+        if page > -1:
+            # The controller is attached to its root widget in _open_common.
+            return getattr(self._notebook.get_nth_page(page), 'editor_controller', None)
         return None
 
     def open_ssb(self, ssb_rom_path: str):
@@ -88,9 +96,9 @@ class EditorNotebookController:
         assert self.file_manager
         if self.file_manager:
             if registered_fname in self._open_editors:
-                self._notebook.set_current_page(self._notebook.page_num(
+                self._notebook.set_current_page(self._page_num_by_root[
                     self._open_editors[registered_fname].get_root_object()
-                ))
+                ])
             else:
                 assert self.rom_data
                 editor_controller = ScriptEditorController(
@@ -109,6 +117,9 @@ class EditorNotebookController:
                     )
                 current_page = self._notebook.get_current_page()
                 root = editor_controller.get_root_object()
+                # Stash the controller on the widget, so page widgets can be mapped
+                # back to their controllers without scanning all open editors.
+                root.editor_controller = editor_controller  # type: ignore
                 self._open_editors[registered_fname] = editor_controller
                 pnum = self._notebook.insert_page(
                     root, tab_label_close_button(
@@ -137,9 +148,9 @@ class EditorNotebookController:
 
     def close_tab(self, filename: str):
         """Close tab for filename. If the tab was not closed, False is returned."""
-        if filename in self._open_editors:
-            controller = self._open_editors[filename]
-            pnum = self._notebook.page_num(controller.get_root_object())
+        controller = self._open_editors.get(filename)
+        if controller is not None:
+            pnum = self._page_num_by_root[controller.get_root_object()]
 
             # SAVE WARNING!
             if controller.has_changes:
@@ -184,14 +195,16 @@ class EditorNotebookController:
         if self._cached_file_bpnt_state is not None:
             editor_filename = self._cached_file_bpnt_state.handler_filename
         is_opening_ssb = editor_filename[-4:] == '.ssb'
-        if editor_filename not in self._open_editors:
+        editor = self._open_editors.get(editor_filename)
+        if editor is None:
             if is_opening_ssb:
                 self.open_ssb(editor_filename)
             else:
                 self.open_exps_macro(editor_filename)
+            editor = self._open_editors[editor_filename]
         else:
-            self._notebook.set_current_page(self._notebook.page_num(self._open_editors[editor_filename].get_root_object()))
-        self._open_editors[editor_filename].focus_opcode(ssb_filename, opcode_addr)
+            self._notebook.set_current_page(self._page_num_by_root[editor.get_root_object()])
+        editor.focus_opcode(ssb_filename, opcode_addr)
 
     def break_pulled(self, state: BreakpointState):
         """The debugger paused. Enable debugger controls for file_name."""
@@ -201,7 +214,9 @@ class EditorNotebookController:
             editor.toggle_debugging_controls(True)
             editor.on_break_pulled(file_state.ssb_filename, file_state.opcode_addr, file_state.halted_on_call)
         self._cached_file_bpnt_state = file_state
-        state.add_release_hook(self.break_released)
+        if state not in self._states_with_release_hook:
+            state.add_release_hook(self.break_released)
+            self._states_with_release_hook.add(state)
 
     def step_into_macro_call(self, state: BreakpointFileState):
         """The debugger paused. Enable debugger controls for file_name."""
@@ -211,6 +226,7 @@ class EditorNotebookController:
 
     def break_released(self, state: BreakpointState):
         """The debugger is no longer paused, disable all debugging controls."""
+        self._states_with_release_hook.discard(state)
         for editor in self._open_editors.values():
             editor.toggle_debugging_controls(False)
             editor.on_break_released()
@@ -220,8 +236,9 @@ class EditorNotebookController:
         """Mark the current execution position for all running scripts. Dict filename -> list (type, id, opcode_addr)"""
         for filename, lines in halt_lines.items():
             self._cached_hanger_halt_lines[filename] = lines
-            if filename in self._open_editors.keys():
-                self._open_editors[filename].insert_hanger_halt_lines(filename, lines)
+            editor = self._open_editors.get(filename)
+            if editor is not None:
+                editor.insert_hanger_halt_lines(filename, lines)
 
     def remove_hanger_halt_lines(self):
         """Remove the marks for the current script execution points"""
@@ -239,16 +256,14 @@ class EditorNotebookController:
 
     def on_ssb_editor_modified(self, controller: ScriptEditorController, modified: bool):
         lbl_box = cast(Gtk.Box, self._notebook.get_tab_label(controller.get_root_object()))
-        lbl = cast(Gtk.Label, lbl_box.get_children()[0])
-        pathsep = os.path.sep
-        if controller.filename.endswith('.ssb'):
-            pathsep = '/'
-        filename = controller.filename.split(pathsep)[-1]
+        # The label is stashed on the box by tab_label_close_button; get_children()
+        # would build a fresh Python list from the GList on every call.
+        lbl = cast(Gtk.Label, lbl_box.label)  # type: ignore
         # TODO: Alert SkyTemple main UI somehow? (via FileManager?)
         if modified:
-            lbl.set_markup(f'<i>{filename}*</i>')
+            lbl.set_markup(controller.tab_label_modified_markup)
         else:
-            lbl.set_markup(f'{filename}')
+            lbl.set_markup(controller.display_name)
 
     def on_ssb_changed_externally(self, ssb_filename, ready_to_reload):
         """
@@ -308,13 +323,16 @@ class EditorNotebookController:
     def get_context(self) -> AbstractDebuggerControlContext:
         return self.parent.context
 
+    def _rebuild_page_num_cache(self, *args):
+        """GTK renumbers pages after inserts, removals and reorders; rebuild the mapping in one pass."""
+        self._page_num_by_root = {
+            self._notebook.get_nth_page(i): i
+            for i in range(self._notebook.get_n_pages())
+        }
+
     def on_page_changed(self, page_widget):
         """Trigger the context event for script editing"""
-        current_open = None
-        for c in self._open_editors.values():
-            if c.get_root_object() == page_widget:
-                current_open = c
-                break
+        current_open = getattr(page_widget, 'editor_controller', None)
         if current_open is not None:
             self.get_context().on_script_edit(current_open.filename)
 
@@ -351,13 +369,17 @@ class EditorNotebookController:
         return response
 
 
-def tab_label_close_button(filename, close_callback):
-    lbl = filename.split('/')[-1]
+@lru_cache(maxsize=256)
+def _tab_display_name(filename: str) -> str:
+    """Trimmed basename shown as tab label. Filenames are stable strings, so this caches near-perfectly."""
+    lbl = filename.rsplit('/', 1)[-1]
     if lbl[-4:] == '.ssb':
-        lbl = lbl[:-4]
-    else:
-        lbl = lbl[:-5]
-    label: Gtk.Label = Gtk.Label.new(lbl)
+        return lbl[:-4]
+    return lbl[:-5]
+
+
+def tab_label_close_button(filename, close_callback):
+    label: Gtk.Label = Gtk.Label.new(_tab_display_name(filename))
     label.set_ellipsize(Pango.EllipsizeMode.START)
     label.props.halign = Gtk.Align.CENTER
     label.set_tooltip_text(filename)
@@ -372,5 +394,6 @@ def tab_label_close_button(filename, close_callback):
     box: Gtk.Box = Gtk.Box.new(Gtk.Orientation.HORIZONTAL, 10)
     box.pack_start(label, True, True, 0)
     box.pack_start(button, True, False, 0)
+    box.label = label  # type: ignore
     box.show_all()
     return box
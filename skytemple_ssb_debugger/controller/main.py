@@ -15,22 +15,25 @@
 #  You should have received a copy of the GNU General Public License
 #  along with SkyTemple.  If not, see <https://www.gnu.org/licenses/>.
 from __future__ import annotations
-import json
 import logging
 import os
 import shutil
 import sys
+import threading
 import webbrowser
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import partial
 from typing import Optional, Dict, List, cast, TypeVar
 from collections.abc import Sequence
 
 import cairo
 import gi
+import numpy as np
+import orjson
 from PIL import Image
 from range_typed_integers import u32
 
-from skytemple_files.common.util import open_utf8, add_extension_if_missing, chunks
+from skytemple_files.common.util import open_utf8, add_extension_if_missing
 from skytemple_ssb_emulator import SCREEN_WIDTH, SCREEN_HEIGHT, emulator_load_controls, Language, emulator_poll, \
     emulator_get_kbcfg, emulator_set_kbcfg, emulator_get_jscfg, emulator_set_jscfg, emulator_keypad_add_key, \
     emulator_keymask, EmulatorKeys, emulator_keypad_rm_key, emulator_touch_release, emulator_supports_joystick, \
@@ -74,10 +77,38 @@ logger = logging.getLogger(__name__)
 
 
 SAVESTATE_EXT_DESUME = 'ds'
+# Maximum number of lines kept in the debug log; older lines are evicted.
+DEBUG_LOG_MAX_LINES = 5000
+# shift, ctrl, both alts; built once, key press events are frequent.
+KEY_MODIFIER_MASK = (Gdk.ModifierType.SHIFT_MASK | Gdk.ModifierType.CONTROL_MASK |
+                     Gdk.ModifierType.MOD1_MASK | Gdk.ModifierType.MOD5_MASK)
 SAVESTATE_EXT_GROUND_ENGINE = 'ge.json'
 COL_VISIBLE = 3
+# Full path to open on double click (eg. "SCRIPT/..." for ssb rows), precomputed
+# at insertion time. Empty for rows that are not openable.
+COL_OPEN_PATH = 4
+# Lower-cased display name, precomputed at insertion time for the search filter.
+COL_NAME_LC = 5
+# All file tree columns, for insert_with_values during bulk population.
+ALL_COLS = [0, 1, 2, 3, 4, 5]
 SKYTEMPLE_WIKI_LINK = 'https://wiki.skytemple.org'
 
+# Widgets toggled together on debugger state transitions; resolved to
+# widget references once at startup.
+DEBUGGING_FEATURE_WIDGET_NAMES = (
+    "emulator_controls_playstop", "emulator_controls_pause", "emulator_controls_reset",
+    "emulator_controls_savestate1", "emulator_controls_savestate2", "emulator_controls_savestate3",
+    "emulator_controls_loadstate1", "emulator_controls_loadstate2", "emulator_controls_loadstate3",
+    "emulator_controls_volume",
+    "variables_save1", "variables_save2", "variables_save3",
+    "variables_load1", "variables_load2", "variables_load3",
+    "variables_notebook_parent",
+)
+PAUSED_FEATURE_WIDGET_NAMES = (
+    "ground_state_files_tree_sw", "ground_state_entities_tree_sw",
+    "macro_variables_sw", "local_variables_sw",
+)
+
 
 class MainController:
     
@@ -97,17 +128,30 @@ class MainController:
         self.breakpoint_state: BreakpointState | None = None
 
         self._click = False
+        self._keyval_to_keymask: dict[int, int] = {}
+        self._pending_touch: tuple[int, int] | None = None
+        # Single worker so queued ROM saves can never run concurrently.
+        self._rom_save_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='rom-save')
+        self._rom_save_future: Future | None = None
         self._debug_log_scroll_to_bottom = False
+        self._log_pending: list[str] = []
+        self._log_flush_scheduled = False
+        self._file_chooser_cache: dict[tuple[Gtk.FileChooserAction, str], Gtk.FileChooserNative] = {}
+        self._unsaved_vars_dialog: Gtk.MessageDialog | None = None
         self._suppress_event = False
         self._stopped = False
         self._resize_timeout_id: int | None = None
+        self._pending_resize_id: int | None = None
 
         self._search_text: str | None = None
+        self._search_text_lc = ""
+        self._filter_expand_id: int | None = None
+        self._max_label_len = 0
         self._ssb_item_filter: Gtk.TreeModelFilter | None = None
 
         self._log_stdout_io_source = None
 
-        self._file_tree_store = Gtk.TreeStore(str, str, str, bool)  # type: ignore
+        self._file_tree_store = Gtk.TreeStore(str, str, str, bool, str, str)  # type: ignore
 
         self._current_screen_width = SCREEN_WIDTH
         self._current_screen_height = SCREEN_HEIGHT
@@ -163,13 +207,34 @@ class MainController:
         self._filter_any.set_name(_("All files"))
         self._filter_any.add_pattern("*")
 
+        self._filter_png = Gtk.FileFilter()
+        self._filter_png.set_name(_("PNG Image (*.png)"))
+        self._filter_png.add_pattern("*.png")
+
         self._poll_emulator_event_id: int | None = None
 
+        self._debugging_feature_widgets = [
+            builder_get_assert(builder, Gtk.Widget, name) for name in DEBUGGING_FEATURE_WIDGET_NAMES
+        ]
+        self._paused_feature_widgets = [
+            builder_get_assert(builder, Gtk.Widget, name) for name in PAUSED_FEATURE_WIDGET_NAMES
+        ]
+        self._bind_widgets()
+
         self.main_draw = builder_get_assert(builder, Gtk.DrawingArea, "draw_main")
-        self.main_draw.set_events(Gdk.EventMask.ALL_EVENTS_MASK)
+        # The top screen is not touchable; don't subscribe it to pointer motion, that
+        # would marshal a Python callback for every pixel the mouse hovers over it.
+        self.main_draw.set_events(
+            Gdk.EventMask.EXPOSURE_MASK | Gdk.EventMask.STRUCTURE_MASK |
+            Gdk.EventMask.BUTTON_PRESS_MASK | Gdk.EventMask.BUTTON_RELEASE_MASK
+        )
         self.main_draw.show()
         self.sub_draw = builder_get_assert(builder, Gtk.DrawingArea, "draw_sub")
-        self.sub_draw.set_events(Gdk.EventMask.ALL_EVENTS_MASK)
+        self.sub_draw.set_events(
+            Gdk.EventMask.EXPOSURE_MASK | Gdk.EventMask.STRUCTURE_MASK |
+            Gdk.EventMask.BUTTON_PRESS_MASK | Gdk.EventMask.BUTTON_RELEASE_MASK |
+            Gdk.EventMask.POINTER_MOTION_MASK | Gdk.EventMask.POINTER_MOTION_HINT_MASK
+        )
         self.sub_draw.show()
 
         self.renderer = None
@@ -185,6 +250,7 @@ class MainController:
             self.settings.get_emulator_keyboard_cfg(),
             self.settings.get_emulator_joystick_cfg()
         )
+        self._rebuild_keymap()
 
         lang = self.settings.get_emulator_language()
         if lang:
@@ -328,8 +394,10 @@ class MainController:
 
     def do_poll_emulator(self):
         try:
-            errs = []
-            while emulator_poll(lambda err: errs.append(err)):
+            self._flush_pending_touch()
+            errs: list[str] = []
+            # Bound method instead of a fresh lambda per poll iteration.
+            while emulator_poll(errs.append):
                 pass
             if len(errs) > 0:
                 # noinspection PyUnusedLocal
@@ -383,20 +451,27 @@ class MainController:
 
     # EMULATOR
     def on_draw_aspect_frame_size_allocate(self, widget: Gtk.AspectFrame, *args):
+        # Live-resizing the window emits a burst of size_allocate signals;
+        # debounce so only the last scale per frame reaches the renderer.
         scale = assert_not_none(widget.get_child()).get_allocated_width() / SCREEN_WIDTH
+        if self._pending_resize_id is not None:
+            GLib.source_remove(self._pending_resize_id)
+        self._pending_resize_id = GLib.timeout_add(16, self._apply_resize, scale)
+
+    def _apply_resize(self, scale):
+        self._pending_resize_id = None
         if self.renderer:
             self.renderer.set_scale(scale)
         self._current_screen_height = round(SCREEN_HEIGHT * scale)
         self._current_screen_width = round(SCREEN_WIDTH * scale)
+        return False
 
     def on_main_window_key_press_event(self, widget: Gtk.Widget, event: Gdk.EventKey, *args):
         # Don't enable controls when in any entry or text view
         if isinstance(self.window.get_focus(), Gtk.Entry) or isinstance(self.window.get_focus(), Gtk.TextView):
             return False
         key = self.lookup_key(event.keyval)
-        # shift,ctrl, both alts
-        mask = Gdk.ModifierType.SHIFT_MASK | Gdk.ModifierType.CONTROL_MASK | Gdk.ModifierType.MOD1_MASK | Gdk.ModifierType.MOD5_MASK
-        if event.state & mask == 0:
+        if event.state & KEY_MODIFIER_MASK == 0:
             if key and self.emu_is_running:
                 emulator_keypad_add_key(key)
                 if key == emulator_keymask(EmulatorKeys.KEY_BOOST):
@@ -463,6 +538,7 @@ class MainController:
     def on_draw_button_release_event(self, widget: Gtk.Widget, event: Gdk.EventButton, display_id: int):
         if display_id == 1 and self._click:
             self._click = False
+            self._flush_pending_touch()
             emulator_touch_release()
         return True
 
@@ -474,6 +550,8 @@ class MainController:
                 _, x, y, state = assert_not_none(widget.get_window()).get_pointer()
                 if state & Gdk.ModifierType.BUTTON1_MASK:
                     self.set_touch_pos(x, y)
+                    # Make sure the initial press registers in the same frame.
+                    self._flush_pending_touch()
         return True
 
     def on_right_event_box_button_press_event(self, widget: Gtk.Widget, *args):
@@ -589,6 +667,7 @@ class MainController:
         if new_keyboard_cfg is not None:
             self._keyboard_cfg = new_keyboard_cfg
             self.settings.set_emulator_keyboard_cfg(self._keyboard_cfg)
+            self._rebuild_keymap()
 
     def on_menu_emulator_joystick_controls_activate(self, button: Gtk.CheckMenuItem, *args):
         if not emulator_supports_joystick():
@@ -652,24 +731,22 @@ class MainController:
         builder_get_assert(self.builder, Gtk.ToggleButton, 'emulator_controls_volume').set_active(button.get_active())
 
     def on_menu_emulator_screenshot_activate(self, button: Gtk.CheckMenuItem, *args):
-        filter_png = Gtk.FileFilter()
-        filter_png.set_name(_("PNG Image (*.png)"))
-        filter_png.add_pattern("*.png")
-
         response, fn = self._file_chooser(Gtk.FileChooserAction.SAVE, _("Save Screenshot..."),
-                                          (filter_png, self._filter_any))
+                                          (self._filter_png, self._filter_any))
 
         if response == Gtk.ResponseType.ACCEPT:
             fn = add_extension_if_missing(fn, 'png')
             raw = emulator_display_buffer_as_rgbx()
-            imgdata = bytearray([0] * len(raw))
-            for i, (a, b, c, _d) in enumerate(chunks(raw, 4)):
-                imgdata[i*4:(i+1)*4] = [c, b, a, 255]
+            # Swap the channels and force the alpha opaque vectorized; doing this
+            # pixel by pixel in Python takes a noticeable pause for both screens.
+            pixels = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 4)
+            imgdata = pixels[:, [2, 1, 0, 3]].copy()
+            imgdata[:, 3] = 255
 
             Image.frombuffer(
                 'RGBA',
                 (SCREEN_WIDTH, SCREEN_HEIGHT_BOTH),
-                imgdata, 'raw', 'RGBA', 0, 1
+                imgdata.tobytes(), 'raw', 'RGBA', 0, 1
             ).save(fn)
 
     # MENU HELP
@@ -775,19 +852,32 @@ class MainController:
     def on_debug_settings_overlay_toggled(self, btn: Gtk.CheckButton):
         if self.debug_overlay:
             self.debug_overlay.toggle(btn.get_active())
+        if self.renderer:
+            # The render tick only redraws on framebuffer changes; while paused or
+            # broken the toggle would otherwise not become visible.
+            self.renderer.queue_draws()
 
     def on_debug_log_scroll_to_bottom_toggled(self, btn: Gtk.ToggleButton):
         self._debug_log_scroll_to_bottom = btn.get_active()
 
     def on_debug_log_clear_clicked(self, btn: Gtk.Button):
-        buff = builder_get_assert(self.builder, Gtk.TextView, 'debug_log_textview').get_buffer()
-        buff.delete(buff.get_start_iter(), buff.get_end_iter())
+        # Deleting the contents of a big log buffer walks every character; swapping
+        # in a fresh buffer is O(1) and lets the old one just be garbage collected.
+        textview = builder_get_assert(self.builder, Gtk.TextView, 'debug_log_textview')
+        self._log_pending.clear()
+        new_buff = Gtk.TextBuffer()
+        textview.set_buffer(new_buff)
+        self._debug_log_textview_right_marker = new_buff.create_mark(
+            'end', new_buff.get_end_iter(), False
+        )
 
     # FILE TREE
 
     def on_ssb_file_search_search_changed(self, search: Gtk.SearchEntry):
         """Filter the main item view using the search field"""
         self._search_text = search.get_text().strip()
+        # Lower-cased once here; the filter callbacks run per row.
+        self._search_text_lc = self._search_text.lower()
         self._filter__refresh_results()
 
     def on_ssb_file_tree_button_press_event(self, tree: Gtk.TreeView, event: Gdk.EventButton):
@@ -797,7 +887,7 @@ class MainController:
                 if model[treeiter][0] == '':
                     tree.expand_row(cast(Gtk.TreePath, model[treeiter].path), False)
                 elif model[treeiter][2] == 'ssb':
-                    self.editor_notebook.open_ssb(SCRIPT_DIR + '/' + model[treeiter][0])
+                    self.editor_notebook.open_ssb(model[treeiter][COL_OPEN_PATH])
                 elif model[treeiter][2] == 'exps_macro':
                     short_path = model[treeiter][0].replace(self.context.get_project_dir() + os.path.sep, '')
                     self.editor_notebook.open_exps_macro(
@@ -862,7 +952,9 @@ class MainController:
         if response == Gtk.ResponseType.OK:
             abs_dirname = row[0] + os.path.sep + dirname
             os.makedirs(abs_dirname, exist_ok=True)
-            store.append(store.get_iter(treepath), [abs_dirname, dirname, 'exps_macro_dir', True])
+            if len(dirname) > self._max_label_len:
+                self._max_label_len = len(dirname)
+            store.append(store.get_iter(treepath), [abs_dirname, dirname, 'exps_macro_dir', True, '', dirname.lower()])
 
     def on_ssb_file_tree__menu_create_macro_file(self, store: Gtk.TreeStore, treepath: Gtk.TreePath, *args):
         row = store[treepath]
@@ -874,7 +966,9 @@ class MainController:
             os.makedirs(row[0], exist_ok=True)
             with open_utf8(abs_filename, 'w') as f:
                 f.write('')
-            store.append(store.get_iter(treepath), [abs_filename, filename, 'exps_macro', True])
+            if len(filename) > self._max_label_len:
+                self._max_label_len = len(filename)
+            store.append(store.get_iter(treepath), [abs_filename, filename, 'exps_macro', True, '', filename.lower()])
 
     def on_ssb_file_tree__menu_delete_dir(self, model: Gtk.TreeModel, treepath: Gtk.TreePath, *args):
         row = model[treepath]
@@ -904,73 +998,160 @@ class MainController:
 
         self._set_sensitve('ssb_file_search', True)
 
-        script_files = self.context.load_script_files()
+        macros_dir_name = self.context.get_project_macro_dir()
+
+        def scan():
+            # Collect everything that needs I/O here in the worker; the tree store itself
+            # may only be touched from the main thread.
+            try:
+                script_files = self.context.load_script_files()
+                macro_dir_walk = list(os.walk(macros_dir_name))
+            except BaseException as ex:
+                exc_info = sys.exc_info()
+                GLib.idle_add(partial(
+                    self.context.display_error, exc_info,
+                    f"Unable to load the script file list:\n{ex}"
+                ))
+                return
+            GLib.idle_add(partial(self._populate_file_tree, script_files, macros_dir_name, macro_dir_walk))
+
+        threading.Thread(target=scan, daemon=True).start()
+
+    def _populate_file_tree(self, script_files, macros_dir_name, macro_dir_walk):
+        ssb_file_tree_store: Gtk.TreeStore = self._file_tree_store
+        tree = builder_get_assert(self.builder, Gtk.TreeView, 'ssb_file_tree')
+        # Detach the model while bulk-inserting; per-row view updates are what makes
+        # populating a large tree slow.
+        tree.set_model(None)
+        try:
+            self._do_populate_file_tree(ssb_file_tree_store, script_files, macros_dir_name, macro_dir_walk)
+            self._compute_max_label_len(ssb_file_tree_store)
+        finally:
+            tree.set_model(self._ssb_item_filter)
+        return False
+
+    def _compute_max_label_len(self, store: Gtk.TreeStore):
+        """
+        Remember the length of the longest row label, so the search filter can skip
+        queries that can never match any row.
+        """
+        max_len = 0
+
+        def visit(model, path, iter):
+            nonlocal max_len
+            label_len = len(model[iter][1])
+            if label_len > max_len:
+                max_len = label_len
+            return False
+
+        store.foreach(visit)
+        self._max_label_len = max_len
 
+    def _do_populate_file_tree(self, ssb_file_tree_store: Gtk.TreeStore, script_files,
+                               macros_dir_name, macro_dir_walk):
         # EXPLORERSCRIPT MACROS
         #    -> Macros
-        macros_dir_name = self.context.get_project_macro_dir()
-        macros_tree_nodes = {macros_dir_name: ssb_file_tree_store.append(
-            None, [macros_dir_name, _('Macros'), 'exps_macro_dir', True]
+        macros_label = _('Macros')
+        macros_tree_nodes = {macros_dir_name: ssb_file_tree_store.insert_with_values(
+            None, -1, ALL_COLS, [macros_dir_name, macros_label, 'exps_macro_dir', True, '', macros_label.lower()]
         )}
-        for root, dnames, fnames in os.walk(macros_dir_name):
+        for root, dnames, fnames in macro_dir_walk:
             root_node = macros_tree_nodes[root]
             for dirname in dnames:
-                macros_tree_nodes[root + os.path.sep + dirname] = ssb_file_tree_store.append(
-                    root_node, [root + os.path.sep + dirname, dirname, 'exps_macro_dir', True]
+                macros_tree_nodes[root + os.path.sep + dirname] = ssb_file_tree_store.insert_with_values(
+                    root_node, -1, ALL_COLS,
+                    [root + os.path.sep + dirname, dirname, 'exps_macro_dir', True, '', dirname.lower()]
                 )
             for filename in fnames:
                 if len(filename) > 4 and filename[-5:] == EXPLORERSCRIPT_EXT:
-                    ssb_file_tree_store.append(root_node, [root + os.path.sep + filename, filename, 'exps_macro', True])
+                    ssb_file_tree_store.insert_with_values(
+                        root_node, -1, ALL_COLS,
+                        [root + os.path.sep + filename, filename, 'exps_macro', True, '', filename.lower()]
+                    )
 
         # SSB SCRIPT FILES
         #    -> Common [common]
-        common_root = ssb_file_tree_store.append(None, ['', _('Common'), 'common_dir', True])
+        common_label = _('Common')
+        common_root = ssb_file_tree_store.insert_with_values(
+            None, -1, ALL_COLS, ['', common_label, 'common_dir', True, '', common_label.lower()]
+        )
         #       -> Master Script (unionall) [ssb]
         #       -> (others) [ssb]
         for name in script_files['common']:
-            ssb_file_tree_store.append(common_root, ['COMMON/' + name, name, 'ssb', True])
+            ssb_file_tree_store.insert_with_values(
+                common_root, -1, ALL_COLS,
+                ['COMMON/' + name, name, 'ssb', True, SCRIPT_DIR + '/COMMON/' + name, name.lower()]
+            )
 
+        enter_label = _('Enter (sse)')
+        enter_label_lc = enter_label.lower()
+        acting_label = _('Acting (ssa)')
+        acting_label_lc = acting_label.lower()
+        sub_label = _('Sub (sss)')
+        sub_label_lc = sub_label.lower()
         for i, map_obj in enumerate(script_files['maps'].values()):
+            # Hoisted out of the inner loops; these prefixes are shared by every
+            # row of the map.
+            map_name = map_obj['name']
+            map_name_lc = map_name.lower()
+            map_prefix = map_name + '/'
+            open_prefix = SCRIPT_DIR + '/' + map_prefix
             #    -> (Map Name) [map]
-            map_root = ssb_file_tree_store.append(None, [map_obj['name'], map_obj['name'], 'map_root', True])
-            self._registered_maps[map_obj['name']] = map_root
+            map_root = ssb_file_tree_store.insert_with_values(
+                None, -1, ALL_COLS, [map_name, map_name, 'map_root', True, '', map_name_lc]
+            )
+            self._registered_maps[map_name] = map_root
 
-            enter_root = ssb_file_tree_store.append(map_root, [map_obj['name'], _('Enter (sse)'), 'map_sse', True])
-            self._tree_branches[f"{map_obj['name']}_enter"] = enter_root
+            enter_root = ssb_file_tree_store.insert_with_values(
+                map_root, -1, ALL_COLS, [map_name, enter_label, 'map_sse', True, '', enter_label_lc]
+            )
+            self._tree_branches[f"{map_name}_enter"] = enter_root
             if map_obj['enter_sse'] is not None:
                 #          -> Script X [ssb]
                 for ssb in map_obj['enter_ssbs']:
-                    ssb_name = f"{map_obj['name']}/{ssb}"
+                    ssb_name = map_prefix + ssb
                     self._scene_types[ssb_name] = 'sse'
-                    self._scene_names[ssb_name] = f"{map_obj['name']}/enter.sse"
-                    ssb_file_tree_store.append(enter_root, [ssb_name, ssb, 'ssb', True])
+                    self._scene_names[ssb_name] = map_prefix + 'enter.sse'
+                    ssb_file_tree_store.insert_with_values(
+                        enter_root, -1, ALL_COLS, [ssb_name, ssb, 'ssb', True, open_prefix + ssb, ssb.lower()]
+                    )
 
             #       -> Acting Scripts [lsd]
-            acting_root = ssb_file_tree_store.append(map_root, [map_obj['name'], _('Acting (ssa)'), 'map_ssa', True])
-            self._tree_branches[f"{map_obj['name']}_acting"] = acting_root
+            acting_root = ssb_file_tree_store.insert_with_values(
+                map_root, -1, ALL_COLS, [map_name, acting_label, 'map_ssa', True, '', acting_label_lc]
+            )
+            self._tree_branches[f"{map_name}_acting"] = acting_root
             for __, ssb in map_obj['ssas']:
                 #             -> Script [ssb]
-                ssb_name = f"{map_obj['name']}/{ssb}"
+                ssb_name = map_prefix + ssb
                 self._scene_types[ssb_name] = 'ssa'
                 self._scene_names[ssb_name] = ssb_name
-                ssb_file_tree_store.append(acting_root, [ssb_name, ssb, 'ssb', True])
+                ssb_file_tree_store.insert_with_values(
+                    acting_root, -1, ALL_COLS, [ssb_name, ssb, 'ssb', True, open_prefix + ssb, ssb.lower()]
+                )
 
             #       -> Sub Scripts [sub]
-            sub_root = ssb_file_tree_store.append(map_root, [map_obj['name'], _('Sub (sss)'), 'map_sss', True])
-            self._tree_branches[f"{map_obj['name']}_subroot"] = sub_root
+            sub_root = ssb_file_tree_store.insert_with_values(
+                map_root, -1, ALL_COLS, [map_name, sub_label, 'map_sss', True, '', sub_label_lc]
+            )
+            self._tree_branches[f"{map_name}_subroot"] = sub_root
             for sss, ssbs in map_obj['subscripts'].items():
                 #          -> (name) [sub_entry]
-                sss_name = f"{map_obj['name']}/{sss}"
+                sss_name = map_prefix + sss
                 self._scene_types[sss_name] = 'sss'
                 self._scene_names[sss_name] = sss_name
-                sub_entry = ssb_file_tree_store.append(sub_root, [sss_name, sss, 'map_sss_entry', True])
+                sub_entry = ssb_file_tree_store.insert_with_values(
+                    sub_root, -1, ALL_COLS, [sss_name, sss, 'map_sss_entry', True, '', sss.lower()]
+                )
                 self._tree_branches[sss_name.replace('/', '_')] = sub_entry
                 for ssb in ssbs:
                     #             -> Script X [ssb]
-                    ssb_name = f"{map_obj['name']}/{ssb}"
+                    ssb_name = map_prefix + ssb
                     self._scene_types[ssb_name] = 'sss'
                     self._scene_names[ssb_name] = sss_name
-                    ssb_file_tree_store.append(sub_entry, [ssb_name, ssb, 'ssb', True])
+                    ssb_file_tree_store.insert_with_values(
+                        sub_entry, -1, ALL_COLS, [ssb_name, ssb, 'ssb', True, open_prefix + ssb, ssb.lower()]
+                    )
 
     # CODE EDITOR NOTEBOOK
     def on_code_editor_notebook_switch_page(self, wdg, page, *args):
@@ -1115,8 +1296,11 @@ class MainController:
             emulator_debug_init_breakpoint_manager(
                 os.path.join(self.context.get_project_debugger_dir(), f'{os.path.basename(fn)}.breakpoints.json')
             )
-            # Immediately save, because the module packs the ROM differently.
-            self.context.save_rom()
+            # Immediately save, because the module packs the ROM differently. The write can
+            # take a while for big ROMs, so it runs in the worker pool while the rest of the
+            # setup continues; everything below works on the in-memory ROM model. The
+            # emulator waits for it before (re-)opening the ROM file.
+            self._rom_save_future = self._rom_save_pool.submit(self.context.save_rom)
             rom_data = self.context.get_static_data()
             if self.debugger:
                 fl1 = []
@@ -1135,6 +1319,10 @@ class MainController:
             self.variable_controller.init(rom_data)
             self.local_variable_controller.init(rom_data)
             self.editor_notebook.init(self.ssb_fm, rom_data)
+            # Resolve the background save before returning to the main loop: every
+            # other save path (e.g. saving a script) writes the ROM synchronously on
+            # the main thread and must not overlap with it.
+            self._wait_pending_rom_save()
             self.rom_was_loaded = True
         except BaseException as ex:
             self.context.display_error(
@@ -1154,42 +1342,17 @@ class MainController:
         code_editor_main.pack_start(code_editor_notebook, True, True, 0)
 
     def enable_debugging_features(self):
-        self._set_sensitve("emulator_controls_playstop", True)
-        self._set_sensitve("emulator_controls_pause", True)
-        self._set_sensitve("emulator_controls_playstop", True)
-        self._set_sensitve("emulator_controls_reset", True)
-        self._set_sensitve("emulator_controls_savestate1", True)
-        self._set_sensitve("emulator_controls_savestate2", True)
-        self._set_sensitve("emulator_controls_savestate3", True)
-        self._set_sensitve("emulator_controls_loadstate1", True)
-        self._set_sensitve("emulator_controls_loadstate2", True)
-        self._set_sensitve("emulator_controls_loadstate3", True)
-        self._set_sensitve("emulator_controls_volume", True)
-
-        self._set_sensitve("variables_save1", True)
-        self._set_sensitve("variables_save2", True)
-        self._set_sensitve("variables_save3", True)
-        self._set_sensitve("variables_load1", True)
-        self._set_sensitve("variables_load2", True)
-        self._set_sensitve("variables_load3", True)
-        self._set_sensitve("variables_notebook_parent", True)
+        for widget in self._debugging_feature_widgets:
+            widget.set_sensitive(True)
 
     def toggle_paused_debugging_features(self, on_off):
         if not on_off:
             if self.editor_notebook:
                 self.editor_notebook.remove_hanger_halt_lines()
-        # These are always on for now. (mostly for performance reason. TODO: Does this lead to issues?)
-        #self._set_sensitve("variables_save1", on_off)
-        #self._set_sensitve("variables_save2", on_off)
-        #self._set_sensitve("variables_save3", on_off)
-        #self._set_sensitve("variables_load1", on_off)
-        #self._set_sensitve("variables_load2", on_off)
-        #self._set_sensitve("variables_load3", on_off)
-        #self._set_sensitve("variables_notebook_parent", on_off)
-        self._set_sensitve("ground_state_files_tree_sw", on_off)
-        self._set_sensitve("ground_state_entities_tree_sw", on_off)
-        self._set_sensitve("macro_variables_sw", on_off)
-        self._set_sensitve("local_variables_sw", on_off)
+        # The variable save/load widgets are always on for now.
+        # (mostly for performance reason. TODO: Does this lead to issues?)
+        for widget in self._paused_feature_widgets:
+            widget.set_sensitive(on_off)
 
     def load_debugger_state(
             self,
@@ -1221,10 +1384,16 @@ class MainController:
                 self.context.get_project_debugger_dir(), f'{rom_basename}.save.{i}.{SAVESTATE_EXT_GROUND_ENGINE}'
             )
 
-            with open_utf8(ground_engine_savestate_path, 'w') as f:
-                assert self.debugger and self.debugger.ground_engine_state
-                json.dump(self.debugger.ground_engine_state.serialize(), f)
+            # Queue the emulator-side savestate first; it is handled by the emulator
+            # thread and independent of the JSON serialization below.
             emulator_savestate_save_file(desmume_savestate_path)
+            assert self.debugger and self.debugger.ground_engine_state
+            data = orjson.dumps(self.debugger.ground_engine_state.serialize())
+            # Write to a temp file and move it in place, so an interrupted write
+            # can not corrupt an existing savestate.
+            with open(ground_engine_savestate_path + '.tmp', 'wb') as f:
+                f.write(data)
+            os.replace(ground_engine_savestate_path + '.tmp', ground_engine_savestate_path)
         except BaseException as err:
             self.context.display_error(
                 sys.exc_info(),
@@ -1252,8 +1421,8 @@ class MainController:
                 self._stopped = False
                 self.emu_reset()
                 emulator_savestate_load_file(desmume_savestate_path)
-                with open_utf8(ground_engine_savestate_path, 'r') as f:
-                    self.debugger.ground_engine_state.deserialize(json.load(f))  # type: ignore
+                with open(ground_engine_savestate_path, 'rb') as f:
+                    self.debugger.ground_engine_state.deserialize(orjson.loads(f.read()))  # type: ignore
                 self.emu_is_running = emulator_is_running()
                 self.load_debugger_state()
                 self.variable_controller.sync()
@@ -1270,36 +1439,43 @@ class MainController:
                 return
 
     def set_touch_pos(self, x: int, y: int):
+        # Called for every motion event while dragging; keep it flat.
         assert self.renderer
         scale = self.renderer.get_scale()
-        rotation = self.renderer.get_screen_rotation()
-        x /= scale
-        y /= scale
-        emu_x = x
-        emu_y = y
-        if rotation == 90 or rotation == 270:
-            emu_x = 256 -y
-            emu_y = x
-
-        if emu_x < 0:
-            emu_x = 0
-        elif emu_x > SCREEN_WIDTH - 1:
-            emu_x = SCREEN_WIDTH - 1
-
-        if emu_y < 9:
-            emu_y = 0
-        elif emu_y > SCREEN_HEIGHT:
-            emu_y = SCREEN_HEIGHT
-
-        emulator_touch_set_pos(int(emu_x), int(emu_y))
+        emu_x = x / scale
+        emu_y = y / scale
+        if self.renderer.get_screen_rotation() in (90, 270):
+            emu_x, emu_y = 256 - emu_y, emu_x
+
+        emu_x = max(0, min(SCREEN_WIDTH - 1, int(emu_x)))
+        emu_y = max(0, min(SCREEN_HEIGHT, int(emu_y)))
+
+        # Only remember the position here; motion events can arrive much faster than the
+        # emulator polling rate, so the latest position is flushed once per poll instead
+        # of queueing a command per event.
+        self._pending_touch = (emu_x, emu_y)
+
+    def _flush_pending_touch(self):
+        if self._pending_touch is not None:
+            emulator_touch_set_pos(*self._pending_touch)
+            self._pending_touch = None
+
+    def _rebuild_keymap(self):
+        """Build the GDK keyval -> emulator keymask lookup from the current keyboard config."""
+        kbcfg = self._keyboard_cfg
+        self._keyval_to_keymask = {
+            kbcfg[i]: emulator_keymask(i + 1) for i in range(0, EmulatorKeys.NB_KEYS)
+        }
 
     def lookup_key(self, keyval):
-        key = 0
-        for i in range(0, EmulatorKeys.NB_KEYS):
-            if keyval == self._keyboard_cfg[i]:
-                key = emulator_keymask(i + 1)
-                break
-        return key
+        return self._keyval_to_keymask.get(keyval, 0)
+
+    def _wait_pending_rom_save(self):
+        """Block until a ROM save queued by load_rom has finished writing to disk."""
+        if self._rom_save_future is not None:
+            future = self._rom_save_future
+            self._rom_save_future = None
+            future.result()
 
     def emu_reset(self):
         if self.breakpoint_state:
@@ -1328,6 +1504,16 @@ class MainController:
             game_mode = arm9data.GAME_MODE.absolute_address
             debug_special_episode_number = ramdata.DEBUG_SPECIAL_EPISODE_NUMBER.absolute_address
             notify_note = arm9data.NOTIFY_NOTE.absolute_address
+        try:
+            self._wait_pending_rom_save()
+        except BaseException as ex:
+            # The background save queued by load_rom failed; the ROM file on disk is
+            # stale or incomplete, so don't hand it to the emulator.
+            self.context.display_error(
+                sys.exc_info(),
+                f"Unable to save: {self.context.get_rom_filename()}\n{ex}"
+            )
+            return
         try:
             lang = self.settings.get_emulator_language()
             if lang:
@@ -1418,32 +1604,51 @@ class MainController:
             self._create_tree_branch(*branch_name.split('_')[0:2])
         self._scene_types[ssb_path] = scene_type
         self._scene_names[ssb_path] = f'{mapname}/{scene_name}'
+        ssb_name = ssb_path.split('/')[-1]
+        if len(ssb_name) > self._max_label_len:
+            self._max_label_len = len(ssb_name)
         ssb_file_tree_store.append(self._tree_branches[branch_name], [
-            ssb_path, ssb_path.split('/')[-1], 'ssb', True
+            ssb_path, ssb_name, 'ssb', True, SCRIPT_DIR + '/' + ssb_path, ssb_name.lower()
         ])
 
     def _create_tree_branch(self, mapname, branch):
         # TODO: Refactor class to only use this method for tree branch creation.
         if mapname not in self._registered_maps:
-            map_root = self._file_tree_store.append(None, [mapname, mapname, 'map_root', True])
+            if len(mapname) > self._max_label_len:
+                self._max_label_len = len(mapname)
+            map_root = self._file_tree_store.append(None, [mapname, mapname, 'map_root', True, '', mapname.lower()])
             self._registered_maps[mapname] = map_root
         map_root = self._registered_maps[mapname]
 
         if branch == 'enter':
-            enter_root = self._file_tree_store.append(map_root, [mapname, _('Enter (sse)'), 'map_sse', True])
+            label = _('Enter (sse)')
+            if len(label) > self._max_label_len:
+                self._max_label_len = len(label)
+            enter_root = self._file_tree_store.append(map_root, [mapname, label, 'map_sse', True, '', label.lower()])
             self._tree_branches[f"{mapname}_enter"] = enter_root
         elif branch == 'acting':
-            acting_root = self._file_tree_store.append(map_root, [mapname, _('Acting (ssa)'), 'map_ssa', True])
+            label = _('Acting (ssa)')
+            if len(label) > self._max_label_len:
+                self._max_label_len = len(label)
+            acting_root = self._file_tree_store.append(map_root, [mapname, label, 'map_ssa', True, '', label.lower()])
             self._tree_branches[f"{mapname}_acting"] = acting_root
         else:
             if f'{mapname}_subroot' not in self._tree_branches:
-                sub_root = self._file_tree_store.append(map_root, [mapname, _('Sub (sss)'), 'map_sss', True])
+                label = _('Sub (sss)')
+                if len(label) > self._max_label_len:
+                    self._max_label_len = len(label)
+                sub_root = self._file_tree_store.append(map_root, [mapname, label, 'map_sss', True, '', label.lower()])
                 self._tree_branches[f"{mapname}_subroot"] = sub_root
             sub_root = self._tree_branches[f"{mapname}_subroot"]
             sss_name = f"{mapname}/{branch.replace('_','/')}"
             self._scene_types[sss_name] = 'sss'
             self._scene_names[sss_name] = sss_name
-            sub_entry = self._file_tree_store.append(sub_root, [sss_name, branch.replace('_', '/'), 'map_sss_entry', True])
+            sub_name = branch.replace('_', '/')
+            if len(sub_name) > self._max_label_len:
+                self._max_label_len = len(sub_name)
+            sub_entry = self._file_tree_store.append(
+                sub_root, [sss_name, sub_name, 'map_sss_entry', True, '', sub_name.lower()]
+            )
             self._tree_branches[sss_name.replace('/', '_')] = sub_entry
 
     def on_script_removed(self, ssb_path):
@@ -1570,17 +1775,60 @@ class MainController:
         item_store = self._file_tree_store
         if self._search_text == "":
             item_store.foreach(self._filter__reset_row, True)
-        else:
-            builder_get_assert(self.builder, Gtk.TreeView, 'ssb_file_tree').collapse_all()
+            return
+        if len(self._search_text) > self._max_label_len:
+            # Longer than the longest label: nothing can match, skip the match pass.
             item_store.foreach(self._filter__reset_row, False)
-            item_store.foreach(self._filter__show_matches)
-            assert self._ssb_item_filter is not None
-            self._ssb_item_filter.foreach(self._filter__expand_all_visible)
+            return
+        tree = builder_get_assert(self.builder, Gtk.TreeView, 'ssb_file_tree')
+        # Every visibility toggle below makes the filter model add or remove rows in
+        # the view; freeze child notifications so the view re-layouts once at thaw
+        # instead of per row.
+        tree.freeze_child_notify()
+        try:
+            tree.collapse_all()
+            # One pass over the model that hides every row and collects the matches,
+            # instead of separate reset / match / expand walks over the full tree.
+            matches: list[Gtk.TreeIter] = []
+            item_store.foreach(self._filter__collect_matches, matches)
+            for match in matches:
+                # Propagate visibility change up and down
+                self._filter__make_path_visible(item_store, match)
+                self._filter__make_subtree_visible(item_store, match)
+        finally:
+            tree.thaw_child_notify()
+        # Expanding needs paths of the filter model and re-enters the filter machinery
+        # per row, so run it as one deferred batch after the visibility updates above
+        # have been processed. Only the newest batch survives while typing.
+        if self._filter_expand_id is not None:
+            GLib.source_remove(self._filter_expand_id)
+        self._filter_expand_id = GLib.idle_add(self._filter__expand_matches, tree, matches)
+
+    def _filter__expand_matches(self, tree: Gtk.TreeView, matches: list[Gtk.TreeIter]):
+        self._filter_expand_id = None
+        assert self._ssb_item_filter is not None
+        item_filter = self._ssb_item_filter
+        item_store = self._file_tree_store
+        tree.freeze_child_notify()
+        try:
+            for match in matches:
+                filter_path = item_filter.convert_child_path_to_path(item_store.get_path(match))
+                if filter_path is not None:
+                    tree.expand_to_path(filter_path)
+        finally:
+            tree.thaw_child_notify()
+        return False
 
     def _filter__reset_row(self, model, path, iter, make_visible):
         """Change the visibility of the given row"""
         model[iter][COL_VISIBLE] = make_visible
 
+    def _filter__collect_matches(self, model, path, iter, matches):
+        """Hide the row and remember it if it matches the current search."""
+        model[iter][COL_VISIBLE] = False
+        if self._search_text_lc in model[iter][COL_NAME_LC]:
+            matches.append(iter)
+
     def _filter__make_path_visible(self, model, iter):
         """Make a row and its ancestors visible"""
         while iter:
@@ -1597,27 +1845,6 @@ class MainController:
             model[subtree][COL_VISIBLE] = True
             self._filter__make_subtree_visible(model, subtree)
 
-    def _filter__expand_all_visible(self, model: Gtk.TreeStore, path, iter):
-        """
-        This is super annoying. Because of the two different "views" on the model,
-        we can't do this in show_matches, because we have to use the filter model here!
-        """
-        if self._search_text:
-            search_query = self._search_text.lower()
-            text = model[iter][1].lower()
-            ssb_file_tree = builder_get_assert(self.builder, Gtk.TreeView, 'ssb_file_tree')
-            if search_query in text:
-                ssb_file_tree.expand_to_path(path)
-
-    def _filter__show_matches(self, model: Gtk.TreeStore, path, iter):
-        if self._search_text:
-            search_query = self._search_text.lower()
-            text = model[iter][1].lower()
-            if search_query in text:
-                # Propagate visibility change up
-                self._filter__make_path_visible(model, iter)
-                # Propagate visibility change down
-                self._filter__make_subtree_visible(model, iter)
     # END CODE DUPLICATION
 
     def _set_sensitve(self, name, state):
@@ -1625,44 +1852,92 @@ class MainController:
         w.set_sensitive(state)
 
     def _file_chooser(self, type: Gtk.FileChooserAction, name, filter):
-        dialog = Gtk.FileChooserNative.new(
-            name,
-            self.window,
-            type,
-            None, None
-        )
-        for f in filter:
-            dialog.add_filter(f)
+        # The set of file choosers is small and fixed; cache them instead of
+        # rebuilding the dialog and re-attaching the filters on every use.
+        # The filters bind on first use for a given (type, name): callers must pass
+        # the long-lived filter objects built in __init__, not fresh ones per call.
+        key = (type, name)
+        dialog = self._file_chooser_cache.get(key)
+        if dialog is None:
+            dialog = Gtk.FileChooserNative.new(
+                name,
+                self.window,
+                type,
+                None, None
+            )
+            for f in filter:
+                dialog.add_filter(f)
+            self._file_chooser_cache[key] = dialog
 
         response = dialog.run()
         fn = dialog.get_filename()
-        dialog.destroy()
+        dialog.hide()
 
         return response, fn
 
+    def _bind_widgets(self):
+        """
+        Resolve the widgets used by the hot UI update paths (emulator buttons, info
+        bar, debug log) once; builder lookups hash the name and re-wrap the GObject
+        on every call.
+        """
+        self._btn_playstop = builder_get_assert(self.builder, Gtk.Button, 'emulator_controls_playstop')
+        self._btn_pause = builder_get_assert(self.builder, Gtk.Button, 'emulator_controls_pause')
+        self._img_play = builder_get_assert(self.builder, Gtk.Image, 'img_play')
+        self._img_play2 = builder_get_assert(self.builder, Gtk.Image, 'img_play2')
+        self._img_stop = builder_get_assert(self.builder, Gtk.Image, 'img_stop')
+        self._img_pause = builder_get_assert(self.builder, Gtk.Image, 'img_pause')
+        self._info_bar = builder_get_assert(self.builder, Gtk.InfoBar, 'info_bar')
+        self._info_bar_label = builder_get_assert(self.builder, Gtk.Label, 'info_bar_label')
+        self._debug_log_textview = builder_get_assert(self.builder, Gtk.TextView, 'debug_log_textview')
+
     def _debugger_print_callback(self, string):
-        textview = builder_get_assert(self.builder, Gtk.TextView, 'debug_log_textview')
-        textview.get_buffer().insert(textview.get_buffer().get_end_iter(), string + '\n')
+        # The debugger tends to print in bursts; inserting and scrolling per line
+        # invalidates the text view layout every time. Collect lines and flush them
+        # as one insert + one scroll per timeout instead.
+        self._log_pending.append(string)
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            GLib.timeout_add(30, self._flush_log)
+
+    def _flush_log(self):
+        self._log_flush_scheduled = False
+        pending = self._log_pending
+        if not pending:
+            return False
+        self._log_pending = []
+        textview = self._debug_log_textview
+        buff = textview.get_buffer()
+        buff.insert(buff.get_end_iter(), '\n'.join(pending) + '\n')
+        # Keep the log bounded; otherwise long sessions with debug logging enabled
+        # make every append and scroll more expensive as the buffer grows.
+        line_count = buff.get_line_count()
+        if line_count > DEBUG_LOG_MAX_LINES:
+            buff.delete(buff.get_start_iter(), buff.get_iter_at_line(line_count - DEBUG_LOG_MAX_LINES))
 
         if self._debug_log_scroll_to_bottom:
             self._suppress_event = True
             textview.scroll_to_mark(self._debug_log_textview_right_marker, 0, True, 0, 0)
             self._suppress_event = False
+        return False
 
     def _warn_about_unsaved_vars(self):
-        md = self.context.message_dialog(
-            self.window,
-            Gtk.DialogFlags.DESTROY_WITH_PARENT, Gtk.MessageType.WARNING,
-            Gtk.ButtonsType.OK_CANCEL,
-            _("You have unsaved changes to variables.\n"
-              "Variables are reset when the game is rebooted.\n"
-              "You need to save the variables and load them after boot.\n\n"
-              "Do you still want to continue?"),
-            title=_("Warning!")
-        )
+        # The text never changes; build the dialog once and reuse it.
+        if self._unsaved_vars_dialog is None:
+            self._unsaved_vars_dialog = self.context.message_dialog(
+                self.window,
+                Gtk.DialogFlags.DESTROY_WITH_PARENT, Gtk.MessageType.WARNING,
+                Gtk.ButtonsType.OK_CANCEL,
+                _("You have unsaved changes to variables.\n"
+                  "Variables are reset when the game is rebooted.\n"
+                  "You need to save the variables and load them after boot.\n\n"
+                  "Do you still want to continue?"),
+                title=_("Warning!")
+            )
+        md = self._unsaved_vars_dialog
 
         response = md.run()
-        md.destroy()
+        md.hide()
 
         if response == Gtk.ResponseType.OK:
             self.variable_controller.variables_changed_but_not_saved = False
@@ -1670,45 +1945,36 @@ class MainController:
         return False
 
     def write_info_bar(self, message_type: Gtk.MessageType, text: str):
-        info_bar = builder_get_assert(self.builder, Gtk.InfoBar, 'info_bar')
-        info_bar_label = builder_get_assert(self.builder, Gtk.Label, 'info_bar_label')
-        info_bar_label.set_text(text)
-        info_bar.set_message_type(message_type)
-        info_bar.set_revealed(True)
+        self._info_bar_label.set_text(text)
+        self._info_bar.set_message_type(message_type)
+        self._info_bar.set_revealed(True)
 
     def clear_info_bar(self):
-        info_bar = builder_get_assert(self.builder, Gtk.InfoBar, 'info_bar')
-        info_bar.set_revealed(False)
+        self._info_bar.set_revealed(False)
 
     def _set_buttons_running(self):
-        btn = builder_get_assert(self.builder, Gtk.Button, 'emulator_controls_playstop')
-        if builder_get_assert(self.builder, Gtk.Image, 'img_play').get_parent():
-            btn.remove(builder_get_assert(self.builder, Gtk.Image, 'img_play'))
-            btn.add(builder_get_assert(self.builder, Gtk.Image, 'img_stop'))
-        btn = builder_get_assert(self.builder, Gtk.Button, 'emulator_controls_pause')
-        if builder_get_assert(self.builder, Gtk.Image, 'img_play2').get_parent():
-            btn.remove(builder_get_assert(self.builder, Gtk.Image, 'img_play2'))
-            btn.add(builder_get_assert(self.builder, Gtk.Image, 'img_pause'))
+        if self._img_play.get_parent():
+            self._btn_playstop.remove(self._img_play)
+            self._btn_playstop.add(self._img_stop)
+        if self._img_play2.get_parent():
+            self._btn_pause.remove(self._img_play2)
+            self._btn_pause.add(self._img_pause)
 
     def _set_buttons_stopped(self):
-        btn = builder_get_assert(self.builder, Gtk.Button, 'emulator_controls_playstop')
-        if builder_get_assert(self.builder, Gtk.Image, 'img_stop').get_parent():
-            btn.remove(builder_get_assert(self.builder, Gtk.Image, 'img_stop'))
-            btn.add(builder_get_assert(self.builder, Gtk.Image, 'img_play'))
-        btn = builder_get_assert(self.builder, Gtk.Button, 'emulator_controls_pause')
-        if builder_get_assert(self.builder, Gtk.Image, 'img_play2').get_parent():
-            btn.remove(builder_get_assert(self.builder, Gtk.Image, 'img_play2'))
-            btn.add(builder_get_assert(self.builder, Gtk.Image, 'img_pause'))
+        if self._img_stop.get_parent():
+            self._btn_playstop.remove(self._img_stop)
+            self._btn_playstop.add(self._img_play)
+        if self._img_play2.get_parent():
+            self._btn_pause.remove(self._img_play2)
+            self._btn_pause.add(self._img_pause)
 
     def _set_buttons_paused(self):
-        btn: Gtk.Button = builder_get_assert(self.builder, Gtk.Button, 'emulator_controls_pause')
-        if builder_get_assert(self.builder, Gtk.Image, 'img_pause').get_parent():
-            btn.remove(builder_get_assert(self.builder, Gtk.Image, 'img_pause'))
-            btn.add(builder_get_assert(self.builder, Gtk.Image, 'img_play2'))
-        btn = builder_get_assert(self.builder, Gtk.Button, 'emulator_controls_playstop')
-        if builder_get_assert(self.builder, Gtk.Image, 'img_play').get_parent():
-            btn.remove(builder_get_assert(self.builder, Gtk.Image, 'img_play'))
-            btn.add(builder_get_assert(self.builder, Gtk.Image, 'img_stop'))
+        if self._img_pause.get_parent():
+            self._btn_pause.remove(self._img_pause)
+            self._btn_pause.add(self._img_play2)
+        if self._img_play.get_parent():
+            self._btn_playstop.remove(self._img_play)
+            self._btn_playstop.add(self._img_stop)
 
     def _show_are_you_sure_delete(self, text):
         dialog: Gtk.MessageDialog = self.context.message_dialog(
@@ -79,6 +79,9 @@ class ScriptEditorController:
         self._main_window = main_window
         self._modified_handler = modified_handler
 
+        self._display_name: str | None = None
+        self._tab_label_modified_markup: str | None = None
+
         self._root = builder_get_assert(self.builder, Gtk.Box, 'code_editor')
         scheme = self.parent.parent.style_scheme_manager.get_scheme(
             self.parent.parent.selected_style_scheme_id
@@ -164,6 +167,21 @@ class ScriptEditorController:
             return self.file_context.ssb_filepath
         return self.file_context.exps_filepath
 
+    @property
+    def display_name(self):
+        """Basename of filename. Computed once and then cached, since it is needed on every modification signal."""
+        if self._display_name is None:
+            pathsep = '/' if self.filename.endswith('.ssb') else os.path.sep
+            self._display_name = self.filename.rsplit(pathsep, 1)[-1]
+        return self._display_name
+
+    @property
+    def tab_label_modified_markup(self):
+        """Tab label markup for the modified state; constant per file, built once."""
+        if self._tab_label_modified_markup is None:
+            self._tab_label_modified_markup = f'<i>{self.display_name}*</i>'
+        return self._tab_label_modified_markup
+
     def toggle_debugging_controls(self, val):
         builder_get_assert(self.builder, Gtk.ToolButton, 'code_editor_cntrls_resume').set_sensitive(val)
         builder_get_assert(self.builder, Gtk.ToolButton, 'code_editor_cntrls_step_over').set_sensitive(val)
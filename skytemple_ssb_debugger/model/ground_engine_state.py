@@ -198,6 +198,26 @@ class GroundEngineState:
             return evt
         return None
 
+    def collect_bounding_boxes_camera(
+            self
+    ) -> tuple[list[tuple[int, int, int, int]], list[tuple[int, int, int, int]],
+               list[tuple[int, int, int, int]], list[tuple[int, int, int, int]]]:
+        """
+        Collect the camera bounding boxes of all valid actors, objects, performers and events
+        in one batched pass, as (x1, y1, x2, y2) tuples per category. This avoids going through
+        the actors/objects/performers/events generator properties entity by entity.
+        """
+        map = self._map
+        boxes: tuple[list[tuple[int, int, int, int]], ...] = ([], [], [], [])
+        tagged: Iterable[tuple[int, AbstractEntity]] = chain(
+            ((0, e) for e in self._actors), ((1, e) for e in self._objects),
+            ((2, e) for e in self._performers), ((3, e) for e in self._events)
+        )
+        for cat, entity in tagged:
+            if entity.valid:
+                boxes[cat].append(entity.get_bounding_box_camera(map))
+        return boxes
+
     def force_reload_ground_objects(self):
         all_entities: Iterable[AbstractEntity] = chain(
             self._actors, self._objects, self._performers, self._events, (self._global_script, self._map)
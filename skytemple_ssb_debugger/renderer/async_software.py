@@ -29,8 +29,16 @@ class AsyncSoftwareRenderer:
     def __init__(self, top_screen: Gtk.Widget, bottom_screen: Gtk.Widget,
                  after_render_hook: Callable[[cairo.Context, int], None] | None = None):
         self._boost = False
-        self._upper_image: cairo.ImageSurface | None = None
-        self._lower_image: cairo.ImageSurface | None = None
+        # One persistent framebuffer for both screens. The cairo surfaces wrap slices of
+        # it and are created exactly once; decode_screen only refreshes the pixel data.
+        self._framebuffer = bytearray(SCREEN_PIXEL_SIZE * 4 * 2)
+        framebuffer_view = memoryview(self._framebuffer)
+        self._upper_image: cairo.ImageSurface = cairo.ImageSurface.create_for_data(
+            framebuffer_view[:SCREEN_PIXEL_SIZE * 4], cairo.FORMAT_RGB24, SCREEN_WIDTH, SCREEN_HEIGHT
+        )
+        self._lower_image: cairo.ImageSurface = cairo.ImageSurface.create_for_data(
+            framebuffer_view[SCREEN_PIXEL_SIZE * 4:], cairo.FORMAT_RGB24, SCREEN_WIDTH, SCREEN_HEIGHT
+        )
         self._after_render_hook = after_render_hook
         self.top_screen = top_screen
         self.bottom_screen = bottom_screen
@@ -39,47 +47,59 @@ class AsyncSoftwareRenderer:
         self.decode_screen()
 
     def screen(self, base_w, base_h, ctx: cairo.Context, display_id: int):
-        if self._upper_image is not None and self._lower_image is not None:
-            if display_id == 0:
-                self.decode_screen()
-
-            ctx.translate(base_w * self._scale / 2, base_h * self._scale / 2)
-            ctx.rotate(-radians(self._screen_rotation_degrees))
-            if self._screen_rotation_degrees == 90 or self._screen_rotation_degrees == 270:
-                ctx.translate(-base_h * self._scale / 2, -base_w * self._scale / 2)
-            else:
-                ctx.translate(-base_w * self._scale / 2, -base_h * self._scale / 2)
-            ctx.scale(self._scale, self._scale)
-            if display_id == 0:
-                ctx.set_source_surface(self._upper_image)
-            else:
-                ctx.set_source_surface(self._lower_image)
-            ctx.get_source().set_filter(cairo.Filter.NEAREST)
-            ctx.paint()
-
-            if self._after_render_hook:
-                self._after_render_hook(ctx, display_id)
+        ctx.translate(base_w * self._scale / 2, base_h * self._scale / 2)
+        ctx.rotate(-radians(self._screen_rotation_degrees))
+        if self._screen_rotation_degrees == 90 or self._screen_rotation_degrees == 270:
+            ctx.translate(-base_h * self._scale / 2, -base_w * self._scale / 2)
+        else:
+            ctx.translate(-base_w * self._scale / 2, -base_h * self._scale / 2)
+        ctx.scale(self._scale, self._scale)
+        if display_id == 0:
+            ctx.set_source_surface(self._upper_image)
+        else:
+            ctx.set_source_surface(self._lower_image)
+        ctx.get_source().set_filter(cairo.Filter.NEAREST)
+        ctx.paint()
+
+        if self._after_render_hook:
+            self._after_render_hook(ctx, display_id)
 
     def decode_screen(self):
-        gpu_framebuffer = memoryview(bytearray(emulator_display_buffer_as_rgbx()))
-        self._upper_image = cairo.ImageSurface.create_for_data(
-            gpu_framebuffer[:SCREEN_PIXEL_SIZE*4], cairo.FORMAT_RGB24, SCREEN_WIDTH, SCREEN_HEIGHT
-        )
+        """Unconditionally fetch the emulator framebuffer and refresh both screen surfaces."""
+        self._framebuffer[:] = emulator_display_buffer_as_rgbx()
+        self._upper_image.mark_dirty()
+        self._lower_image.mark_dirty()
 
-        self._lower_image = cairo.ImageSurface.create_for_data(
-            gpu_framebuffer[SCREEN_PIXEL_SIZE*4:], cairo.FORMAT_RGB24, SCREEN_WIDTH, SCREEN_HEIGHT
-        )
+    def queue_draws(self):
+        """Request a redraw of both screens regardless of framebuffer changes.
 
-    def start(self):
+        The tick only redraws on framebuffer changes, so overlays that appear or
+        disappear while the emulator is paused need to request a draw explicitly.
+        """
         self.top_screen.queue_draw()
         self.bottom_screen.queue_draw()
+
+    def start(self):
+        self.queue_draws()
         GLib.timeout_add(int(1000 / FRAMES_PER_SECOND), self._tick)
 
     def _tick(self):
         if self.top_screen is None or self.bottom_screen is None:
             return False
-        self.top_screen.queue_draw()
-        self.bottom_screen.queue_draw()
+        # Fetch the emulator framebuffer once per tick and only refresh + redraw the
+        # screens whose pixels actually changed. While the emulator is paused or a menu
+        # is idle this makes the 60 FPS tick a cheap byte comparison with no drawing.
+        frame = emulator_display_buffer_as_rgbx()
+        framebuffer = self._framebuffer
+        half = SCREEN_PIXEL_SIZE * 4
+        if frame[:half] != framebuffer[:half]:
+            framebuffer[:half] = frame[:half]
+            self._upper_image.mark_dirty()
+            self.top_screen.queue_draw()
+        if frame[half:] != framebuffer[half:]:
+            framebuffer[half:] = frame[half:]
+            self._lower_image.mark_dirty()
+            self.bottom_screen.queue_draw()
         return True
 
     def reshape(self, draw: Gtk.DrawingArea, display_id: int):
@@ -87,6 +107,8 @@ class AsyncSoftwareRenderer:
 
     def set_boost(self, state):
         self._boost = state
+        # Show/hide the boost indicator immediately, even with no new frame coming in.
+        self.queue_draws()
 
     def set_scale(self, value):
         self._scale = value